@@ -23,9 +23,9 @@ setup(
         'License :: Commercial',  # example license
         'Operating System :: OS Independent',
         'Programming Language :: Python',
-        # replace these appropriately if you are using Python 3 
         'Programming Language :: Python :: 2',
         'Programming Language :: Python :: 2.7',
+        'Programming Language :: Python :: 3',
         'Topic :: Internet :: WWW/HTTP',
         'Topic :: Internet :: WWW/HTTP :: Dynamic Content',
     ],
@@ -1 +1 @@
-from vault import SimpleVault
+from simplevault.vault import SimpleVault
@@ -1,6 +1,11 @@
-import base64
 import pyaes
 
+try:
+    from base64 import encodebytes, decodebytes
+except ImportError:
+    # Python 2
+    from base64 import encodestring as encodebytes, decodestring as decodebytes
+
 
 class AESCipher: 
     """
@@ -16,6 +21,8 @@ class AESCipher:
     """
     def __init__(self, key):
         self.bs = 32
+        if not isinstance(key, bytes):
+            key = key.encode('utf-8')
         if len(key) >= 32:
             self.key = key[:32]
         else:
@@ -24,15 +31,16 @@ class AESCipher:
     def encrypt(self, plaintext):
         cipher = pyaes.AESModeOfOperationCTR(self.key)
         ciphertext = cipher.encrypt(plaintext)
-        return base64.encodestring(ciphertext)
+        return encodebytes(ciphertext)
 
     def decrypt(self, ciphertext):
         cipher = pyaes.AESModeOfOperationCTR(self.key)
-        cleartext = cipher.decrypt(base64.decodestring(ciphertext))
+        cleartext = cipher.decrypt(decodebytes(ciphertext))
         return cleartext
 
     def _pad(self, s):
-        return s + (self.bs - len(s) % self.bs) * chr(self.bs - len(s) % self.bs)
+        n = self.bs - len(s) % self.bs
+        return s + bytes(bytearray([n] * n))
 
     def _unpad(self, s):
         return s[:-ord(s[len(s)-1:])]
@@ -41,18 +49,18 @@ class AESCipher:
 if __name__ == '__main__':
     # test pure implementation
     from pyaes import AESModeOfOperationCTR as AES
-    aes = AES('This_key_for_demo_purposes_only!')
-    plaintext = 'thequickbrownfoxjumpsoverthelazydog'
+    aes = AES(b'This_key_for_demo_purposes_only!')
+    plaintext = b'thequickbrownfoxjumpsoverthelazydog'
     cipher = aes.encrypt(plaintext)
     # -- we have to reinitialize the AES to decrypt
-    aes = AES('This_key_for_demo_purposes_only!')
+    aes = AES(b'This_key_for_demo_purposes_only!')
     decrypt = aes.decrypt(cipher)
     assert decrypt == plaintext, "expected >%s<==>%s<" % (decrypt, plaintext)
-    print "OK pure mode"
+    print("OK pure mode")
     # test wrapper 
     aes = AESCipher('testkey')
-    plaintext = 'thequickbrownfoxjumpsoverthelazydog'
+    plaintext = b'thequickbrownfoxjumpsoverthelazydog'
     cipher = aes.encrypt(plaintext)
     decrypt = aes.decrypt(cipher)
     assert decrypt == plaintext, "expected >%s<==>%s<" % (decrypt, plaintext)
-    print "OK wrapped mode" 
\ No newline at end of file
+    print("OK wrapped mode") 
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+asyncio interface to SimpleVault (requires Python 3.7+)
+
+Usage:
+
+    import asyncio
+    from simplevault.aio import AsyncSimpleVault
+
+    async def main():
+        vault = AsyncSimpleVault(location='/path/to/vault')
+        crypt = await vault.make('myvault', '/path/to/source', upload=True)
+        # fetch several vaults concurrently
+        return await asyncio.gather(vault.unvault('myvault', '/path/to/target'),
+                                    vault.unvault('other', '/path/to/other'))
+
+    files = asyncio.run(main())
+"""
+import asyncio
+import functools
+import os
+
+from simplevault.vault import SimpleVault, encrypt_file, decrypt_file
+
+
+class AsyncSimpleVault(SimpleVault):
+    """
+    SimpleVault with coroutine make/unvault
+
+    No blocking work runs on the event loop. AES encryption/decryption
+    runs in executor, or the loop's default executor if not given. The
+    key and file paths are the only arguments sent to it, so a
+    concurrent.futures.ProcessPoolExecutor can be used to run the pure
+    Python AESCipher on other cores. s3 transfers, zip, extract and
+    other file operations run in the loop's default (thread) executor.
+
+    Semantics are the same as SimpleVault.make and SimpleVault.unvault,
+    and vaults created by either class can be read by the other. Use
+    different vault names for concurrent calls on the same instance, as
+    each name uses its own temporary directory.
+    """
+    def __init__(self, key=None, location=None,
+                 s3_bucket=None, s3_path=None,
+                 s3_useragent=None, executor=None):
+        super(AsyncSimpleVault, self).__init__(key=key, location=location,
+                                               s3_bucket=s3_bucket,
+                                               s3_path=s3_path,
+                                               s3_useragent=s3_useragent)
+        self.executor = executor
+
+    def run_in_thread(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(None,
+                                    functools.partial(func, *args, **kwargs))
+
+    def run_in_executor(self, func, *args):
+        # func must be a module level function so it can be pickled
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self.executor, func, *args)
+
+    async def make(self, name=None, src=None, include=None, upload=True):
+        """
+        coroutine version of SimpleVault.make
+        """
+        assert self.key, "you have to give a key or set in S3_VAULT_KEY"
+        assert name, "give a vault name"
+        vault_tmp, vault_zip, vault_crypt = await self.run_in_thread(
+            self.directories, name)
+        await self.run_in_thread(self.archive, src or self.location,
+                                 vault_zip, vault_crypt, include=include)
+        await self.run_in_executor(encrypt_file, self.key,
+                                   vault_zip, vault_crypt)
+        if upload:
+            assert self.s3_path, "No s3_path specified"
+            assert self.s3_bucket, "No s3_bucket specified"
+            await self.run_in_thread(self.upload, vault_crypt,
+                                     self.s3_bucket, self.s3_file(name))
+        return vault_crypt
+
+    async def unvault(self, name, target=None, download=True):
+        """
+        coroutine version of SimpleVault.unvault
+        """
+        assert self.key, "you have to give a key or set in $VAULT_KEY"
+        assert name, "give a vault name"
+        vault_tmp, vault_zip, vault_crypt = await self.run_in_thread(
+            self.directories, name)
+        if download:
+            assert self.s3_path, "No s3_path specified"
+            assert self.s3_bucket, "No s3_bucket specified"
+            assert self.s3_useragent, "you need to provide $S3_VAULT_USERAGENT"
+            await self.run_in_thread(self.download, self.s3_bucket,
+                                     self.s3_file(name), vault_crypt)
+            exists = await self.run_in_thread(os.path.exists, vault_crypt)
+            assert exists, "Download failed for %s" % self.s3_file(name)
+        await self.run_in_executor(decrypt_file, self.key,
+                                   vault_crypt, vault_zip)
+        members = await self.run_in_thread(self.extract, vault_zip,
+                                           vault_crypt,
+                                           target or self.location)
+        self.extracted_files.extend(members)
+        await self.run_in_thread(self.cleanup, name)
+        return members
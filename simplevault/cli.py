@@ -8,8 +8,8 @@ def makevault(site=None, location='~/.vault', s3bucket='', s3path='vault',
     vault = SimpleVault(s3_bucket=s3bucket, s3_path=s3path,
                         location=location, key=key)
     crypt = vault.make(site, include=files, upload=True)
-    print "Ok, created %s and uploaded to s3://%s/%s" % (crypt, s3bucket, s3path)
-    print "export S3_VAULT_KEY=%s" % vault.key
+    print("Ok, created %s and uploaded to s3://%s/%s" % (crypt, s3bucket, s3path))
+    print("export S3_VAULT_KEY=%s" % vault.key)
     
 def unvault(site=None, location='~/.vault', s3bucket='', s3path='vault', 
             files=None, key=None):
@@ -17,11 +17,11 @@ def unvault(site=None, location='~/.vault', s3bucket='', s3path='vault',
     vault = SimpleVault(s3_bucket=s3bucket, s3_path=s3path,
                         location=location, key=key)
     files = vault.unvault(site, download=True)
-    print "Extracted %s" % files
+    print("Extracted %s" % files)
     
 def console_mkvault():
     if not len(sys.argv) == 4:
-        print "mkvault name location bucket/path"
+        print("mkvault name location bucket/path")
         exit(1)
     bucket, path = sys.argv[3].split('/', 1)
     main('--write',
@@ -32,7 +32,7 @@ def console_mkvault():
     
 def console_unvault():
     if not len(sys.argv) == 4:
-        print "unvault name bucket/path location"
+        print("unvault name bucket/path location")
         exit(1)
     bucket, path = sys.argv[2].split('/', 1)
     main('--extract',
@@ -73,21 +73,21 @@ def main(*realargs):
         crypt = vault.make(args.name, include=args.include, 
                            upload=not args.noremote)
         if not args.noremote:
-            print "[INFO]  created %s and uploaded to s3://%s/%s" % (crypt, 
-                                                                 args.s3bucket, 
-                                                                 args.path)
+            print("[INFO]  created %s and uploaded to s3://%s/%s" % (crypt,
+                                                                  args.s3bucket,
+                                                                  args.path))
         else:
-            print "[INFO] created %s and stored in %s" % (crypt, args.path)
-        print "[WARN] Extract using export S3_VAULT_KEY=%s" % vault.key
+            print("[INFO] created %s and stored in %s" % (crypt, args.path))
+        print("[WARN] Extract using export S3_VAULT_KEY=%s" % vault.key)
     elif args.extract:
         from simplevault import SimpleVault
         vault = SimpleVault(s3_bucket=args.s3bucket, s3_path=args.path,
                             location=args.location, key=args.key)
         files = vault.unvault(args.name, target=args.location or args.path, 
                               download=not args.noremote)
-        print "Extracted %s" % files
+        print("Extracted %s" % files)
     else:
-        print "[ERROR] Either --write or --extract must be used"
+        print("[ERROR] Either --write or --extract must be used")
 
 
 if __name__ == '__main__':
@@ -1,12 +1,16 @@
 def urlretrieve(url, fpath, headers=None):
     # adopted from http://stackoverflow.com/a/2028750/890242
-    import urllib2
-    request = urllib2.Request(url)
+    try:
+        from urllib.request import Request, urlopen
+    except ImportError:
+        # Python 2
+        from urllib2 import Request, urlopen
+    request = Request(url)
     if headers:
         request.add_header(*headers) 
-    urlfile = urllib2.urlopen(request)
+    urlfile = urlopen(request)
     chunk = 4096
-    f = open(fpath, "w")
+    f = open(fpath, "wb")
     while True:
         data = urlfile.read(chunk)
         if not data:
@@ -1,3 +1,4 @@
+import binascii
 import os
 import shutil
 from uuid import uuid4
@@ -13,6 +14,29 @@ AWS_ACCESS_KEY = os.environ.get('AWS_ACCESS_KEY_ID')
 AWS_SECRET_ACCESS_KEY = os.environ.get('AWS_SECRET_ACCESS_KEY')
 AWS_ENDPOINT = os.environ.get('AWS_ENDPOINT', 's3-eu-west-1.amazonaws.com') 
 
+
+def encrypt_file(key, source, target):
+    """
+    encrypt the file source into target using key
+    """
+    with open(source, 'rb') as vz, open(target, 'wb') as vc:
+        zipped = vz.read()
+        aes = AESCipher(key)
+        c = aes.encrypt(zipped)
+        vc.write(c)
+
+
+def decrypt_file(key, source, target):
+    """
+    decrypt the file source into target using key
+    """
+    with open(target, 'wb') as vz, open(source, 'rb') as vc:
+        c = vc.read()
+        aes = AESCipher(key)
+        plain = aes.decrypt(c)
+        vz.write(plain)
+
+
 class SimpleVault(object):
     """
     Simple file based vault system - store and deploy secrets, secured.
@@ -112,20 +136,9 @@ class SimpleVault(object):
         assert self.key, "you have to give a key or set in S3_VAULT_KEY"
         assert name, "give a vault name"
         vault_tmp, vault_zip, vault_crypt = self.directories(name)
-        try:
-            os.remove(vault_zip)
-            os.remove(vault_crypt)
-        except:
-            pass
-        # create zip file
-        self.zipfiles(src or self.location, vault_zip, 
-                      exclude='.vault', 
-                      include=include)
-        with open(vault_zip) as vz, open(vault_crypt, 'w') as vc:
-            zipped = vz.read()
-            aes = AESCipher(self.key)
-            c = aes.encrypt(zipped)
-            vc.write(c)
+        self.archive(src or self.location, vault_zip, vault_crypt,
+                     include=include)
+        encrypt_file(self.key, vault_zip, vault_crypt)
         if upload:
             assert self.s3_path, "No s3_path specified"
             assert self.s3_bucket, "No s3_bucket specified"
@@ -142,22 +155,37 @@ class SimpleVault(object):
             assert self.s3_useragent, "you need to provide $S3_VAULT_USERAGENT"
             self.download(self.s3_bucket, self.s3_file(name), vault_crypt)
             assert os.path.exists(vault_crypt), "Download failed for %s" % self.s3_file(name)
-        with open(vault_zip, 'w') as vz, open(vault_crypt) as vc:
-            c = vc.read()
-            aes = AESCipher(self.key)
-            plain = aes.decrypt(c)
-            vz.write(plain)
-        try:
-            zipf = ZipFile(vault_zip)
-            zipf.extractall(target or self.location)
-        except BadZipfile as e:
-            raise BadZipfile('Could not extract %s. Did you set the key?' % vault_crypt)
-        members = [os.path.join(target or self.location, member) 
-                   for member in zipf.namelist()]
+        decrypt_file(self.key, vault_crypt, vault_zip)
+        members = self.extract(vault_zip, vault_crypt, target or self.location)
         self.extracted_files.extend(members)
         self.cleanup(name)
         return members
     
+    def archive(self, source, vault_zip, vault_crypt, include=None):
+        """
+        remove previous vault files and zip source into vault_zip
+        """
+        try:
+            os.remove(vault_zip)
+            os.remove(vault_crypt)
+        except:
+            pass
+        # create zip file
+        self.zipfiles(source, vault_zip, 
+                      exclude='.vault', 
+                      include=include)
+
+    def extract(self, vault_zip, vault_crypt, target):
+        """
+        extract all members of vault_zip into target, return their paths
+        """
+        try:
+            zipf = ZipFile(vault_zip)
+            zipf.extractall(target)
+        except BadZipfile as e:
+            raise BadZipfile('Could not extract %s. Did you set the key?' % vault_crypt)
+        return [os.path.join(target, member) for member in zipf.namelist()]
+
     def s3_file(self, name):
         return os.path.join(self.s3_path, '%s.crypt' % name).replace('//', '/')
             
@@ -165,7 +193,7 @@ class SimpleVault(object):
         connection = tinys3.Connection(AWS_ACCESS_KEY, 
                         AWS_SECRET_ACCESS_KEY,
                         tls=True, endpoint=AWS_ENDPOINT)
-        with open(source) as f:
+        with open(source, 'rb') as f:
             connection.upload(path, f, bucket=bucket, public=False)
          
     def download(self, bucket, path, localfile):
@@ -175,7 +203,7 @@ class SimpleVault(object):
                     headers=('User-agent', self.s3_useragent))
         
     def zipfiles(self, source, target, exclude=None, include=None):
-        with open(target, 'w') as zipf:
+        with open(target, 'wb') as zipf:
             zipfile = ZipFile(zipf, 'w')
             for dir, dirs, files in os.walk(source):
                 if exclude in dir:
@@ -199,4 +227,4 @@ class SimpleVault(object):
         shutil.rmtree(vault_tmp)
         
     def secret_key(self, bytes=16):
-        return os.urandom(16).encode('hex')
\ No newline at end of file
+        return str(binascii.hexlify(os.urandom(16)).decode('ascii'))
\ No newline at end of file
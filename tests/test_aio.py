@@ -0,0 +1,189 @@
+import os
+import sys
+import unittest
+from subprocess import call
+from uuid import uuid4
+from zipfile import BadZipfile
+
+from simplevault.vault import SimpleVault
+from tests.test_vault import SimpleVaultMockS3, S3_MOCK_PATH
+
+
+VAULT_PATH = '/tmp/simplevault_aio'
+VAULT_PATH2 = '%sOther' % VAULT_PATH
+S3_MOCK_BUCKET = 's3mock_aio'
+
+_mock_s3_class = None
+
+
+def async_mock_s3_class():
+    """ AsyncSimpleVault with SimpleVaultMockS3 upload and download """
+    # simplevault.aio can only be imported on Python 3.7+
+    global _mock_s3_class
+    if _mock_s3_class is None:
+        from simplevault.aio import AsyncSimpleVault
+
+        class AsyncSimpleVaultMockS3(SimpleVaultMockS3, AsyncSimpleVault):
+            pass
+
+        _mock_s3_class = AsyncSimpleVaultMockS3
+    return _mock_s3_class
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "asyncio API requires Python 3.7+")
+class AsyncSimpleVaultTests(unittest.TestCase):
+
+    def setUp(self):
+        import asyncio
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        import asyncio
+        self.loop.close()
+        asyncio.set_event_loop(None)
+        call(('rm -rf %s %s %s' % (VAULT_PATH, VAULT_PATH2,
+                                   os.path.join(S3_MOCK_PATH,
+                                                S3_MOCK_BUCKET))).split(' '))
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def get_vault(self, key, location=VAULT_PATH, **kwargs):
+        from simplevault.aio import AsyncSimpleVault
+        return AsyncSimpleVault(key, location=location, **kwargs)
+
+    def get_mock_s3_vault(self, key, location=VAULT_PATH, **kwargs):
+        return async_mock_s3_class()(key, location=location,
+                   s3_bucket=S3_MOCK_BUCKET, s3_path='vault',
+                   s3_useragent='someuseragent', **kwargs)
+
+    def write_secret(self, fn, plain):
+        with open(fn, 'w') as f:
+            f.write(plain)
+
+    def test_make_unvault(self):
+        plain = "This is a secret"
+        key = uuid4().hex
+        vault = self.get_vault(key)
+        secret_file = '%s/secret.txt' % VAULT_PATH
+        self.write_secret(secret_file, plain)
+        crypt = self.run_async(vault.make('test', VAULT_PATH, upload=False))
+        self.assertTrue(os.path.exists(crypt))
+        with open(crypt) as f:
+            self.assertNotEqual(f.read(), plain)
+        os.remove(secret_file)
+        files = self.run_async(vault.unvault('test', download=False))
+        self.assertIn(secret_file, files)
+        with open(secret_file) as f:
+            self.assertEqual(plain, f.read())
+
+    def test_make_unvault_s3(self):
+        plain = "This is a secret"
+        key = uuid4().hex
+        vault = self.get_mock_s3_vault(key)
+        secret_file = '%s/secret.txt' % VAULT_PATH
+        self.write_secret(secret_file, plain)
+        crypt = self.run_async(vault.make('test', VAULT_PATH, upload=True))
+        s3_file = os.path.join(S3_MOCK_PATH, S3_MOCK_BUCKET,
+                               vault.s3_file('test'))
+        self.assertTrue(os.path.exists(s3_file))
+        # only the uploaded copy is left to unvault from
+        os.remove(secret_file)
+        os.remove(crypt)
+        files = self.run_async(vault.unvault('test', download=True))
+        self.assertIn(secret_file, files)
+        with open(secret_file) as f:
+            self.assertEqual(plain, f.read())
+
+    def test_interoperable_with_sync(self):
+        plain = "This is a secret"
+        key = uuid4().hex
+        secret_file = '%s/secret.txt' % VAULT_PATH
+        secret_file2 = '%s/secret.txt' % VAULT_PATH2
+        vault = SimpleVault(key, location=VAULT_PATH, s3_path='vault')
+        self.write_secret(secret_file, plain)
+        vault.make('test', VAULT_PATH, upload=False)
+        os.remove(secret_file)
+        # a vault made synchronously can be extracted asynchronously
+        avault = self.get_vault(key, s3_path='vault')
+        files = self.run_async(
+            avault.unvault('test', target=VAULT_PATH2, download=False))
+        self.assertIn(secret_file2, files)
+        with open(secret_file2) as f:
+            self.assertEqual(plain, f.read())
+        self.assertEqual(avault.s3_file('test'), vault.s3_file('test'))
+
+    def test_unvault_concurrent(self):
+        import asyncio
+        plain = "This is a secret"
+        key = uuid4().hex
+        vault = self.get_mock_s3_vault(key)
+        names = ['test%d' % i for i in range(5)]
+        for name in names:
+            os.makedirs(os.path.join(VAULT_PATH2, name))
+            self.write_secret(os.path.join(VAULT_PATH2, name, 'secret.txt'),
+                              plain + name)
+        self.run_async(asyncio.gather(
+            *[vault.make(name, os.path.join(VAULT_PATH2, name))
+              for name in names]))
+        results = self.run_async(asyncio.gather(
+            *[vault.unvault(name, target=os.path.join(VAULT_PATH, name))
+              for name in names]))
+        for name, files in zip(names, results):
+            secret_file = os.path.join(VAULT_PATH, name, 'secret.txt')
+            self.assertIn(secret_file, files)
+            with open(secret_file) as f:
+                self.assertEqual(plain + name, f.read())
+
+    def test_make_unvault_process_executor(self):
+        from concurrent.futures import ProcessPoolExecutor
+        plain = "This is a secret"
+        key = uuid4().hex
+        secret_file = '%s/secret.txt' % VAULT_PATH
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            vault = self.get_mock_s3_vault(key, executor=executor)
+            self.write_secret(secret_file, plain)
+            crypt = self.run_async(vault.make('test', VAULT_PATH))
+            os.remove(secret_file)
+            os.remove(crypt)
+            files = self.run_async(vault.unvault('test'))
+        self.assertIn(secret_file, files)
+        with open(secret_file) as f:
+            self.assertEqual(plain, f.read())
+
+    def test_executor_runs_crypto(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from simplevault.vault import encrypt_file, decrypt_file
+        submitted = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                submitted.append(fn)
+                return super(RecordingExecutor, self).submit(fn, *args,
+                                                              **kwargs)
+
+        key = uuid4().hex
+        with RecordingExecutor(max_workers=1) as executor:
+            vault = self.get_vault(key, executor=executor)
+            self.write_secret('%s/secret.txt' % VAULT_PATH, "secret")
+            self.run_async(vault.make('test', VAULT_PATH, upload=False))
+            self.run_async(vault.unvault('test', download=False))
+        self.assertEqual(submitted, [encrypt_file, decrypt_file])
+
+    def test_make_unvault_invalidkey(self):
+        plain = "This is a secret"
+        key = uuid4().hex
+        vault = self.get_vault(key)
+        secret_file = '%s/secret.txt' % VAULT_PATH
+        self.write_secret(secret_file, plain)
+        self.run_async(vault.make('test', VAULT_PATH, upload=False))
+        vault = self.get_vault(key[-1:])
+        os.remove(secret_file)
+        with self.assertRaises(BadZipfile):
+            self.run_async(vault.unvault('test', download=False))
+        self.assertFalse(os.path.exists(secret_file))
+
+
+if __name__ == "__main__":
+    unittest.main()
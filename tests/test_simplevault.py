@@ -63,7 +63,7 @@ class SimpleVaultTests(TestCase):
         for fn in secret_files:
             os.remove(fn)
         files = vault.unvault('test', download=False)
-        print files
+        print(files)
         for fn in secret_files:
             self.assertIn(fn, files)
             self.assertTrue(os.path.exists(fn))
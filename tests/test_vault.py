@@ -27,7 +27,7 @@ class SimpleVaultMockS3(SimpleVault):
 
     def download(self, bucket, path, localfile):
         s3file = os.path.join(S3_MOCK_PATH, bucket, path)
-        with open(s3file) as s, open(localfile) as f:
+        with open(s3file) as s, open(localfile, 'w') as f:
             data = s.read()
             f.write(data)
 